@@ -8,33 +8,280 @@ Description:    A streamlit dashboard displaying insights from Ken Jee's YouTube
 
 Classes:        n/a
 
-Methods:        load_data               - loads csv data to pandas dataframes
+Methods:        _read_csv               - reads a csv with pyarrow's multithreaded reader
+                _shrink_dtypes          - downcast numeric columns to 32-bit
+                load_data               - loads csv data to pandas dataframes
+                load_comments           - loads the comments csv, only when it's needed
                 engineer_df_agg         - formats columns and data types of one of the datasets
                 engineer_df_time        - formats data types in another dataset
                 engineer_df_time_diff   - combines df_agg & df_time to find performance from
                                             publish date
+                _column_medians         - median of each column of a numpy array
+                get_rolling_medians     - finds the 6 & 12 month medians of numeric stats
                 get_vid_stat_trends     - compares video stats to a median baseline
                 get_header_stats        - selects a set of metrics to have as Big Numbers
+                index_by_video_title    - index & sort a dataframe by video title
                 build_sidebar           - frontend formatting of the streamlit sidebar
                 _format_header_metrics  - frontend formatting of the Big Numbers
-                _style_positive_negative - colour +ve and -ve numbers green and red
+                _style_positive_negative - colour +ve and -ve numbers green and red, per block
                 _display_df_agg_diff    - frontend formatting of a pandas dataframe
                 _video_select           - display a selectbox for user to select video
-                _audience_sample        - group viwer country into distinct categories
+                _filter_video           - select a single video's rows by title
                 _engineer_subscriber_data - add columns and sort dataframe for display
                 _vid_subscriber_chart   - display a plotly chart of viewers, grouped by country
                 _engineer_avg_vid_performances - find 20,50,80th percentile view counts per day
                 _engineer_vid_performance - find running total for view counts of a selected video
+                _line                   - build a WebGL line trace for plotly figures
+                _vid_performance_chart  - display a plotly chart of a video's running view count
                 total_dashboard         - main method for building the entire frontend
 """
 
 import os
+import json
+import tempfile
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+from pyarrow import csv as pacsv
+from pyarrow import parquet as pq
 import plotly.graph_objects as go
 import plotly.express as px
 import streamlit as st
-from datetime import datetime
+
+
+# readable names for the raw Aggregated_Metrics_By_Video.csv columns, in file order
+AGG_COLS = (
+    "Video",
+    "Video Title",
+    "Video Publish Time",
+    "Comments Added",
+    "Shares",
+    "Dislikes",
+    "Likes",
+    "Subscribers Lost",
+    "Subscribers Gained",
+    "RPM(USD)",
+    "CPM(USD)",
+    "Average % Viewed",
+    "Average View Duration",
+    "Views",
+    "Watch Time(hours)",
+    "Subscribers",
+    "Your Estimated Revenue(USD)",
+    "Impressions",
+    "Impressions Click-through Rate(%)",
+)
+
+# arrow types for the raw aggregated metrics, so the csv reader doesn't have to infer
+# them. Any column not listed (ids, titles, view duration) is still inferred
+AGG_COL_TYPES = {
+    "Video Publish Time": pa.timestamp("s"),
+    "Comments Added": pa.int64(),
+    "Shares": pa.int64(),
+    "Dislikes": pa.int64(),
+    "Likes": pa.int64(),
+    "Subscribers Lost": pa.int64(),
+    "Subscribers Gained": pa.int64(),
+    "RPM(USD)": pa.float64(),
+    "CPM(USD)": pa.float64(),
+    "Average % Viewed": pa.float64(),
+    "Views": pa.int64(),
+    "Watch Time(hours)": pa.float64(),
+    "Subscribers": pa.int64(),
+    "Your Estimated Revenue(USD)": pa.float64(),
+    "Impressions": pa.int64(),
+    "Impressions Click-through Rate(%)": pa.float64(),
+}
+
+# numeric metrics shown as Big Numbers in the dashboard header
+HEADER_NUMERIC = (
+    "Views",
+    "Likes",
+    "Subscribers",
+    "Shares",
+    "Comments Added",
+    "RPM(USD)",
+    "Average % Viewed",
+    "AVG_DURATION_SEC",
+    "ENGAGEMENT_RATIO",
+    "VIEWS / SUBS_GAINED",
+)
+
+# columns shown in the aggregate metrics table, mapped to their display names
+DISPLAY_COLS = {
+    'Video Title': 'Video Title',
+    'Video Publish Time': 'Publish Date',
+    'Views': 'Views',
+    'Likes': 'Likes',
+    'Subscribers': 'Subscribers',
+    'AVG_DURATION_SEC': 'Avg Watch Duration (s)',
+    'ENGAGEMENT_RATIO': 'Engagement ratio',
+    'VIEWS / SUBS_GAINED': 'Views per Sub Gained',
+}
+
+# country codes with their own group in the subscriber chart, everything else is 'Other'
+COUNTRY_NAMES = {
+    'US': 'USA',
+    'GB': 'United Kingdom',
+    'IN': 'India',
+}
+
+# lookback windows for the median baselines, as fixed day counts (~6 & 12 months)
+WINDOW_6MONTH = np.timedelta64(182, 'D')
+WINDOW_12MONTH = np.timedelta64(365, 'D')
+
+# max number of videos sent to the browser at once in the aggregate metrics table
+DISPLAY_PAGE_SIZE = 200
+
+# parquet metadata key holding the csv stats & reader options a cached table came from
+PARQUET_CACHE_KEY = b"ken_dashboard.csv_source"
+
+
+def _shrink_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Downcast the numeric columns of a freshly loaded dataframe to 32-bit. The counts
+    (views, likes, subscribers etc.) and ratios all fit comfortably, and it halves the
+    memory every later median/subtract/divide pass has to read.
+
+    Args:
+        df  - a dataframe, as read from one of the raw .csv files
+    Returns:
+        df  - the same dataframe, with int64 -> int32 and float64 -> float32
+    -----------------------------------------------------------------------------------
+    Summary of Changes
+    -----------------------------------------------------------------------------------
+    Euan Newlands       15 Oct 2026     v0.1 - Initial Script
+    """
+    int32_info = np.iinfo(np.int32)
+    for col in df.select_dtypes(include=["int64"]).columns:
+        # only downcast if every value fits, otherwise leave as int64
+        if df[col].min() >= int32_info.min and df[col].max() <= int32_info.max:
+            df[col] = df[col].astype(np.int32)
+
+    float_cols = df.select_dtypes(include=["float64"]).columns
+    df[float_cols] = df[float_cols].astype(np.float32)
+
+    return df
+
+
+def _read_csv(
+        path: str,
+        skip_rows_after_names: int = 0,
+        timestamp_parsers: list[str]|None = None,
+        newlines_in_values: bool = False,
+        column_names: list[str]|None = None,
+        column_types: dict|None = None
+    ) -> pd.DataFrame:
+    """Read a .csv file with pyarrow's multithreaded csv reader, and convert it to a
+    Pandas DataFrame. Parsing is done in C++ across threads (releasing the GIL), which
+    is a lot quicker than pd.read_csv for the larger raw files.
+        The parsed table is also saved next to the .csv as a .parquet file. On later
+    runs the .parquet is read instead (already typed, nothing to parse), as long as it was
+    made from a .csv of the same size & mtime with the same reader options.
+
+    Args:
+        path                    - path to the .csv file
+        skip_rows_after_names   - number of rows to skip directly after the header row
+        timestamp_parsers       - strptime formats to try when inferring datetime columns,
+                                    None uses pyarrow's default (ISO8601)
+        newlines_in_values      - True if quoted values may contain line breaks (free
+                                    text), slower as the file can't be split at any
+                                    newline
+        column_names            - names to give the columns in place of the header row,
+                                    None keeps the file's own header
+        column_types            - arrow type of each named column, columns not listed
+                                    have their type inferred
+    Returns:
+        df                      - dataframe of the .csv contents
+    -----------------------------------------------------------------------------------
+    Summary of Changes
+    -----------------------------------------------------------------------------------
+    Euan Newlands       15 Oct 2026     v0.1 - Initial Script
+    """
+    parquet_path = os.path.splitext(path)[0] + ".parquet"
+
+    # everything the parsed table depends on. An equality check rather than "parquet is
+    # newer", as a csv re-extracted from the Kaggle zip keeps the archive's older mtime
+    csv_stat = os.stat(path)
+    cache_key = json.dumps(
+        {
+            "csv_size": csv_stat.st_size,
+            "csv_mtime_ns": csv_stat.st_mtime_ns,
+            "skip_rows_after_names": skip_rows_after_names,
+            "timestamp_parsers": timestamp_parsers,
+            "newlines_in_values": newlines_in_values,
+            "column_names": column_names,
+            "column_types": {
+                name: str(arrow_type) for name, arrow_type in (column_types or {}).items()
+            },
+        },
+        sort_keys=True
+    ).encode()
+
+    table = None
+    try:
+        # only the footer is read to check the key, the columns are left on disk if stale
+        parquet_metadata = pq.read_schema(parquet_path).metadata or {}
+        if parquet_metadata.get(PARQUET_CACHE_KEY) == cache_key:
+            table = pq.read_table(parquet_path)
+    except (OSError, pa.ArrowException):
+        # no parquet yet, or a truncated/corrupt one, parse the csv instead
+        table = None
+
+    if table is None:
+        table = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(
+                use_threads=True,
+                # header row is skipped when the names are given, the file's own are unused
+                skip_rows=0 if column_names is None else 1,
+                skip_rows_after_names=skip_rows_after_names,
+                column_names=column_names
+            ),
+            parse_options=pacsv.ParseOptions(newlines_in_values=newlines_in_values),
+            convert_options=pacsv.ConvertOptions(
+                column_types=column_types, timestamp_parsers=timestamp_parsers
+            )
+        )
+        # arrow infers H:M:S values as a time of day, but in these exports they're
+        # durations (e.g. average view duration). Reinterpret them as durations while still
+        # in arrow, so pandas gets timedelta64 rather than a datetime.time object per row
+        for i, field in enumerate(table.schema):
+            if pa.types.is_time(field.type):
+                raw_int = pa.int32() if field.type.bit_width == 32 else pa.int64()
+                durations = (
+                    table.column(i)
+                    .cast(raw_int)
+                    .cast(pa.int64())
+                    .cast(pa.duration(field.type.unit))
+                )
+                table = table.set_column(i, field.name, durations)
+
+        table = table.replace_schema_metadata({PARQUET_CACHE_KEY: cache_key})
+
+        # write to a temp file in the same directory and swap it in, so a killed process
+        # or two sessions writing at once never leave a half written file at parquet_path
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                suffix=".parquet.tmp", dir=os.path.dirname(os.path.abspath(parquet_path))
+            )
+            os.close(fd)
+            pq.write_table(table, tmp_path, compression="snappy")
+            os.replace(tmp_path, parquet_path)
+        except (OSError, pa.ArrowException):
+            # e.g. read-only data directory, just parse the csv again next time
+            if tmp_path is not None:
+                with suppress(OSError):
+                    os.remove(tmp_path)
+
+    # self_destruct frees each arrow column as it's converted, to keep peak memory down
+    df = table.to_pandas(
+        split_blocks=True, self_destruct=True, coerce_temporal_nanoseconds=True
+    )
+
+    return df
 
 
 @st.cache_data
@@ -43,7 +290,7 @@ def load_data(path_to_data: str) -> list[pd.DataFrame]:
     Pandas DataFrames.
     
     Args:
-        None
+        path_to_data    - path to the directory containing the .csv files
     Returns:
         dfs -   a list of dataframes, with each containing data from one of
                 the .csv raw data files
@@ -53,33 +300,79 @@ def load_data(path_to_data: str) -> list[pd.DataFrame]:
     Euan Newlands       05 Feb 2024     v0.1 - Initial Script
     Euan Newlands       07 Feb 2024     v0.2 - Added os.path.join, which is an operating
                                                 system agnostic method of handling paths
+    Euan Newlands       15 Oct 2026     v0.3 - Read with the pyarrow csv engine and parse
+                                                `Video Publish Time` at read time
+    Euan Newlands       15 Oct 2026     v0.4 - Skip the totals row with skiprows rather
+                                                than slicing it off after the read
+    Euan Newlands       15 Oct 2026     v0.5 - Downcast numeric columns to 32-bit
+    Euan Newlands       15 Oct 2026     v0.6 - Read the 4 files concurrently with pyarrow's
+                                                multithreaded csv reader, via _read_csv
+    Euan Newlands       15 Oct 2026     v0.7 - Comments no longer loaded, see load_comments
+    Euan Newlands       15 Oct 2026     v0.8 - df_agg columns named & typed at read time
     """
     # get file paths
     agg_path = os.path.join(path_to_data, "Aggregated_Metrics_By_Video.csv")
     agg_sub_path = os.path.join(
         path_to_data, "Aggregated_Metrics_By_Country_And_Subscriber_Status.csv"
     )
-    comments_path = os.path.join(path_to_data, "All_Comments_Final.csv")
     time_path = os.path.join(path_to_data, "Video_Performance_Over_Time.csv")
 
-    # remove first row from dataframe, which is the YT calculated totals
-    df_agg = pd.read_csv(agg_path).iloc[1:, :]
-    # load remining files as are
-    df_agg_sub = pd.read_csv(agg_sub_path)
-    df_comments = pd.read_csv(comments_path)
-    df_time = pd.read_csv(time_path)
+    # pyarrow releases the GIL while parsing, so all 3 files can be read at once
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # skip first data row, which is the YT calculated totals, so it's never loaded.
+        # Columns get their readable names & types as it's read, so nothing is inferred
+        # for the numeric columns and `Video Publish Time` is parsed straight to a datetime
+        agg_future = executor.submit(
+            _read_csv,
+            agg_path,
+            skip_rows_after_names=1,
+            timestamp_parsers=["%b %d, %Y"],
+            column_names=list(AGG_COLS),
+            column_types=AGG_COL_TYPES
+        )
+        # load remining files as are
+        agg_sub_future = executor.submit(_read_csv, agg_sub_path)
+        time_future = executor.submit(_read_csv, time_path)
+
+        df_agg = agg_future.result()
+        df_agg_sub = agg_sub_future.result()
+        df_time = time_future.result()
 
-    dfs = [df_agg, df_agg_sub, df_comments, df_time]
+    # numbers all fit in 32-bit, half the memory for every downstream pass
+    dfs = [_shrink_dtypes(df) for df in (df_agg, df_agg_sub, df_time)]
 
     return dfs
 
 
+@st.cache_data
+def load_comments(path_to_data: str) -> pd.DataFrame:
+    """This function loads the video comments data, downloaded from Kaggle, from .csv to
+    a Pandas DataFrame. Kept separate from load_data as no page uses the comments yet, so
+    they're only loaded when a page that needs them calls this.
+
+    Args:
+        path_to_data    - path to the directory containing the .csv files
+    Returns:
+        df_comments     - dataframe containing the comments on each video
+    -----------------------------------------------------------------------------------
+    Summary of Changes
+    -----------------------------------------------------------------------------------
+    Euan Newlands       15 Oct 2026     v0.1 - Initial Script, moved out of load_data
+    """
+    comments_path = os.path.join(path_to_data, "All_Comments_Final.csv")
+    # comments are free text, quoted values can run over several lines
+    df_comments = _shrink_dtypes(_read_csv(comments_path, newlines_in_values=True))
+
+    return df_comments
+
+
+@st.cache_data(show_spinner=False)
 def engineer_df_agg(df_agg: pd.DataFrame) -> pd.DataFrame:
-    """This function modifies the raw df_agg dataframe by renaming columns to be
-    more readable and enforcing the following;
-        - `Video Publish Time` data type conversion; pd.object -> pd.datetime64ns
-        - `Average View Duration` data type conversion; pd.object -> pd.datetime64ns
+    """This function modifies the raw df_agg dataframe, whose columns are already named
+    by load_data, enforcing the following;
+        - `Average View Duration` data type conversion; pd.object -> pd.timedelta64ns
         - `AVG_DURATION_SEC` column added
+        - `Video` & `Video Title` data type conversion; pd.object -> pd.Categorical
         - `ENGAGEMENT_RATIO` column added
         - `VIEWS / SUBS_GAINED` column added
 
@@ -92,59 +385,59 @@ def engineer_df_agg(df_agg: pd.DataFrame) -> pd.DataFrame:
     Summary of Changes
     -----------------------------------------------------------------------------------
     Euan Newlands       05 Feb 2024     v0.1 - Initial Script
+    Euan Newlands       15 Oct 2026     v0.2 - Parse `Average View Duration` with
+                                                pd.to_timedelta instead of a per-row
+                                                strptime apply
+    Euan Newlands       15 Oct 2026     v0.3 - Cached with st.cache_data; works on a copy
+                                                so the caller's dataframe isn't mutated
+    Euan Newlands       15 Oct 2026     v0.4 - Rename and sort out-of-place (set_axis,
+                                                sort_values) instead of the defensive copy
+    Euan Newlands       15 Oct 2026     v0.5 - `Video Publish Time` now parsed in load_data
+    Euan Newlands       15 Oct 2026     v0.6 - ENGAGEMENT_RATIO and VIEWS / SUBS_GAINED
+                                                calculated in place on float32 arrays
+    Euan Newlands       15 Oct 2026     v0.7 - Column names moved to module level AGG_COLS
+    Euan Newlands       15 Oct 2026     v0.8 - Hide the st.cache_data spinner on a cache miss
+    Euan Newlands       15 Oct 2026     v0.9 - `Video` & `Video Title` made categorical
+    Euan Newlands       15 Oct 2026     v0.10 - Column rename removed, load_data names
+                                                the columns as it reads them
+    Euan Newlands       15 Oct 2026     v0.11 - Engineered columns downcast to 32-bit
     """
-    # column renames due to funny something going on with the raw data
-    df_agg.columns = [
-        "Video",
-        "Video Title",
-        "Video Publish Time",
-        "Comments Added",
-        "Shares",
-        "Dislikes",
-        "Likes",
-        "Subscribers Lost",
-        "Subscribers Gained",
-        "RPM(USD)",
-        "CPM(USD)",
-        "Average % Viewed",
-        "Average View Duration",
-        "Views",
-        "Watch Time(hours)",
-        "Subscribers",
-        "Your Estimated Revenue(USD)",
-        "Impressions",
-        "Impressions Click-through Rate(%)",
-    ]
-
-    # string to datetime conversion
-    df_agg["Video Publish Time"] = pd.to_datetime(
-        df_agg["Video Publish Time"], format="%b %d, %Y"
-    )
-
-    # string to H:M:S timestamp format, to calculate avg watch in seconds
-    df_agg["Average View Duration"] = df_agg["Average View Duration"].apply(
-        lambda x: datetime.strptime(x, "%H:%M:%S")
-    )
-    df_agg["AVG_DURATION_SEC"] = df_agg["Average View Duration"].apply(
-        lambda x: x.second + x.minute * 60. + x.hour * 3600.
-    )
+    # H:M:S string to timedelta (vectorised), to calculate avg watch in seconds. A no-op
+    # if _read_csv already converted the column to a duration
+    df_agg["Average View Duration"] = pd.to_timedelta(df_agg["Average View Duration"])
+    df_agg["AVG_DURATION_SEC"] = df_agg["Average View Duration"].dt.total_seconds()
+
+    # video ids/titles are filtered on, categorical makes each == an integer code compare
+    for col in ["Video", "Video Title"]:
+        df_agg[col] = df_agg[col].astype("category")
+
+    # "Cool data points" from raw data. Accumulate into one float32 buffer (a fresh copy
+    # of Comments Added) rather than building a temporary Series for every + and /
+    views = df_agg["Views"].to_numpy(dtype=np.float32)
+    engagement = df_agg["Comments Added"].to_numpy(dtype=np.float32, copy=True)
+    with np.errstate(divide="ignore", invalid="ignore"):  # 0 views/subs -> inf/nan
+        engagement += df_agg["Shares"].to_numpy()
+        engagement += df_agg["Likes"].to_numpy()
+        engagement += df_agg["Dislikes"].to_numpy()
+        engagement /= views
+        views_per_sub = np.divide(
+            views, df_agg["Subscribers Gained"].to_numpy(), dtype=np.float32
+        )
 
-    # "Cool data points" from raw data
-    df_agg["ENGAGEMENT_RATIO"] = (
-        df_agg["Comments Added"]
-        + df_agg["Shares"]
-        + df_agg["Likes"]
-        + df_agg["Dislikes"]
-    ) / df_agg["Views"]
+    df_agg["ENGAGEMENT_RATIO"] = engagement
+    df_agg["VIEWS / SUBS_GAINED"] = views_per_sub
 
-    df_agg["VIEWS / SUBS_GAINED"] = df_agg["Views"] / df_agg["Subscribers Gained"]
+    # AVG_DURATION_SEC comes out of total_seconds as float64, bring it (and anything else
+    # that's been widened) back to 32-bit before the medians & trends read it
+    df_agg = _shrink_dtypes(df_agg)
 
     # order by video publish date
-    df_agg.sort_values("Video Publish Time", ascending=False, inplace=True)
+    df_agg = df_agg.sort_values("Video Publish Time", ascending=False, ignore_index=True)
 
     return df_agg
 
 
+@st.cache_data(show_spinner=False)
 def engineer_df_time(df_time: pd.DataFrame) -> pd.DataFrame:
     """This function modifies the raw df_time dataframe by formatting the time column
     data type from string to datetime.
@@ -157,14 +450,30 @@ def engineer_df_time(df_time: pd.DataFrame) -> pd.DataFrame:
     Summary of Changes
     -----------------------------------------------------------------------------------
     Euan Newlands       05 Feb 2024     v0.1 - Initial Script
+    Euan Newlands       15 Oct 2026     v0.2 - Sept -> Sep fix uses the .str accessor
+                                                rather than a per-row apply
+    Euan Newlands       15 Oct 2026     v0.3 - Cached with st.cache_data; works on a copy
+                                                so the caller's dataframe isn't mutated
+    Euan Newlands       15 Oct 2026     v0.4 - Hide the st.cache_data spinner on a cache miss
+    Euan Newlands       15 Oct 2026     v0.5 - Only the distinct date strings are fixed and
+                                                parsed
     """
-    # string to datetime conversion, first formatting Sept -> 3 letter variation
-    df_time["Date"] = df_time["Date"].apply(lambda x: x.replace("Sept", "Sep"))
-    df_time["Date"] = pd.to_datetime(df_time["Date"], format="%d %b %Y")
+    # work on a copy, so cached/caller dataframes are never mutated
+    df_time = df_time.copy()
+
+    # string to datetime conversion, first formatting Sept -> 3 letter variation. There's
+    # one row per video per day, so only the distinct date strings are fixed & parsed,
+    # then mapped back onto every row by their factorized codes
+    date_codes, unique_dates = pd.factorize(df_time["Date"])
+    unique_dates = pd.to_datetime(
+        unique_dates.str.replace("Sept", "Sep", regex=False), format="%d %b %Y"
+    )
+    df_time["Date"] = unique_dates.take(date_codes, allow_fill=True, fill_value=pd.NaT)
 
     return df_time
 
 
+@st.cache_data(show_spinner=False)
 def engineer_df_time_diff(df_agg: pd.DataFrame, df_time: pd.DataFrame) -> pd.DataFrame:
     """Combines video publish date from df_agg and daily video performance data from df_time
     to return a dataframe that contains the video's performance in days since published. Note
@@ -180,6 +489,7 @@ def engineer_df_time_diff(df_agg: pd.DataFrame, df_time: pd.DataFrame) -> pd.Dat
     Summary of Changes
     -----------------------------------------------------------------------------------
     Euan Newlands       11 Feb 2024     v0.1 - Initial Script
+    Euan Newlands       15 Oct 2026     v0.2 - Cached with st.cache_data, without the spinner
     """
     df_time_diff = pd.merge(df_time, df_agg.loc[:,[
         "Video", "Video Publish Time"
@@ -192,16 +502,96 @@ def engineer_df_time_diff(df_agg: pd.DataFrame, df_time: pd.DataFrame) -> pd.Dat
     return df_time_diff
 
 
-def get_vid_stat_trends(df_agg: pd.DataFrame) -> pd.DataFrame:
-    """This function calculates median statistics over 12 months, and compares each
-    individual video's statistics against this median baseline. The median value is
-    subtracted from the video's statistics to calculate how the video perfromed against
-    the median baseline. The returned values are used to display which video's performed
-    best/worst on the dashboard.
+def _column_medians(arr: np.ndarray) -> np.ndarray:
+    """Median of each column of a 2D array, skipping missing values like pandas does.
+    np.nanmedian falls back to a python level loop over the columns, so it's only used
+    when there are NaNs; otherwise np.median finds every column's median in one
+    vectorised partition.
+
+    Args:
+        arr     - 2D numeric array, rows are videos & columns are metrics
+    Returns:
+        medians - 1D array with the median of each column
+    -----------------------------------------------------------------------------------
+    Summary of Changes
+    -----------------------------------------------------------------------------------
+    Euan Newlands       15 Oct 2026     v0.1 - Initial Script
+    """
+    if np.isnan(arr).any():
+        medians = np.nanmedian(arr, axis=0)
+    else:
+        medians = np.median(arr, axis=0)
+
+    return medians
+
+
+@st.cache_data(show_spinner=False)
+def get_rolling_medians(df_agg: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+    """Calculates the 12 month median of every numeric column and the 6 month median of
+    the HEADER_NUMERIC columns, where the windows are measured back from the latest
+    video's publish date. Both get_vid_stat_trends and get_header_stats compare against
+    these baselines, so they are found once here and passed into each.
+
+    Args:
+        df_agg          - dataframe containing the raw data of video interactions, aggregated
+                            by Country and Subscriber status
+    Returns:
+        median_6mo      - series containing the 6 month median of each header metric
+        median_12mo     - series containing the 12 month median of each numeric column
+    -----------------------------------------------------------------------------------
+    Summary of Changes
+    -----------------------------------------------------------------------------------
+    Euan Newlands       15 Oct 2026     v0.1 - Initial Script, median logic moved out of
+                                                get_vid_stat_trends & get_header_stats
+    Euan Newlands       15 Oct 2026     v0.2 - 6 month median only over HEADER_NUMERIC,
+                                                the only columns it's used for
+    Euan Newlands       15 Oct 2026     v0.3 - Windows are fixed day counts, compared on
+                                                the datetime64 array
+    Euan Newlands       15 Oct 2026     v0.4 - Medians taken on a float32 numpy array
+    Euan Newlands       15 Oct 2026     v0.5 - Hide the st.cache_data spinner on a cache miss
+    Euan Newlands       15 Oct 2026     v0.6 - Only the 12 month rows are converted, the
+                                                6 month median reuses them
+    Euan Newlands       15 Oct 2026     v0.7 - Medians found with _column_medians
+    """
+    # find median on numeric data, only if record within 6 & 12 months to latest video
+    publish_time = df_agg["Video Publish Time"].to_numpy()
+    latest_publish = publish_time.max()
+    mask_12month = publish_time >= latest_publish - WINDOW_12MONTH
+    # the 6 month window sits inside the 12 month one, so mask within those rows only
+    mask_6month = publish_time[mask_12month] >= latest_publish - WINDOW_6MONTH
+
+    # pull just the last 12 months of the numeric block out as one float32 array, older
+    # videos & the date column are never copied
+    # timedelta counts as numeric to select_dtypes, `Average View Duration` has no median
+    numeric_cols = df_agg.select_dtypes(
+        include=[np.number], exclude=[np.timedelta64]
+    ).columns
+    numeric_arr_12month = df_agg.loc[mask_12month, numeric_cols].to_numpy(dtype=np.float32)
+    header_idx = numeric_cols.get_indexer(list(HEADER_NUMERIC))
+
+    median_12mo = pd.Series(
+        _column_medians(numeric_arr_12month), index=numeric_cols
+    )
+    median_6mo = pd.Series(
+        _column_medians(numeric_arr_12month[np.ix_(mask_6month, header_idx)]),
+        index=list(HEADER_NUMERIC)
+    )
+
+    return median_6mo, median_12mo
+
+
+@st.cache_data(show_spinner=False)
+def get_vid_stat_trends(df_agg: pd.DataFrame, median_12mo: pd.Series) -> pd.DataFrame:
+    """This function compares each individual video's statistics against the 12 month
+    median baseline. The median value is subtracted from the video's statistics to
+    calculate how the video perfromed against the median baseline. The returned values
+    are used to display which video's performed best/worst on the dashboard.
     
     Args:
         df_agg      - dataframe containing the raw data of video interactions, aggregated
                         by Country and Subscriber status
+        median_12mo - series containing the 12 month median of each numeric column, from
+                        get_rolling_medians
     Returns:
         df_agg_diff - a dataframe containing the % difference of video stats compared to
                         the 12-month median values.
@@ -209,36 +599,48 @@ def get_vid_stat_trends(df_agg: pd.DataFrame) -> pd.DataFrame:
     Summary of Changes
     -----------------------------------------------------------------------------------
     Euan Newlands       07 Feb 2024     v0.1 - Initial Script
+    Euan Newlands       15 Oct 2026     v0.2 - Numeric columns found with select_dtypes,
+                                                so 32-bit dtypes are included too
+    Euan Newlands       15 Oct 2026     v0.3 - Cached with st.cache_data
+    Euan Newlands       15 Oct 2026     v0.4 - 12 month median passed in, calculated by
+                                                get_rolling_medians
+    Euan Newlands       15 Oct 2026     v0.5 - Trends calculated on float32 numpy arrays
+    Euan Newlands       15 Oct 2026     v0.6 - Hide the st.cache_data spinner on a cache miss
+    Euan Newlands       15 Oct 2026     v0.7 - Subtract & divide done in place
+    Euan Newlands       15 Oct 2026     v0.8 - Shallow copy of df_agg, only the numeric
+                                                block is copied
     """
-    # initialise a copy to work with
-    df_agg_diff = df_agg.copy()
-    # find median on numeric data, only if record within 12 months to latest video
-    metric_date_12month = df_agg_diff["Video Publish Time"].max() - pd.DateOffset(
-        months=12
-    )
-    median_12mo_agg = df_agg_diff[
-        df_agg_diff["Video Publish Time"] >= metric_date_12month
-    ].median(numeric_only=True)
-
-    # compare numeric column records to the 12 month median values
-    numeric_cols = np.array(
-        (df_agg_diff.dtypes == "int64") | (df_agg_diff.dtypes == "float64")
-    )
-    df_agg_diff.iloc[:, numeric_cols] = (
-        df_agg_diff.iloc[:, numeric_cols] - median_12mo_agg
-    ).div(median_12mo_agg)
+    # compare numeric column records to the 12 month median values. The median row is
+    # put in the same column order, so a plain numpy broadcast replaces label alignment.
+    # The subtract & divide are done in place on one fresh copy, no temporaries
+    # select_dtypes treats timedelta as numeric, leave `Average View Duration` out
+    numeric_cols = df_agg.select_dtypes(
+        include=[np.number], exclude=[np.timedelta64]
+    ).columns
+    numeric_arr = df_agg[numeric_cols].to_numpy(dtype=np.float32, copy=True)
+    median_arr = median_12mo[numeric_cols].to_numpy(dtype=np.float32)
+    with np.errstate(divide="ignore", invalid="ignore"):  # 0 median -> inf/nan
+        numeric_arr -= median_arr
+        numeric_arr /= median_arr
+
+    # shallow copy, non-numeric columns (titles etc.) are shared with df_agg rather than
+    # duplicated. Assigning the numeric columns swaps in new arrays, df_agg is untouched
+    df_agg_diff = df_agg.copy(deep=False)
+    df_agg_diff[numeric_cols] = numeric_arr
 
     return df_agg_diff
 
 
-def get_header_stats(df_agg: pd.DataFrame) -> tuple[pd.DataFrame,pd.DataFrame]:
+def get_header_stats(
+        median_6mo: pd.Series,
+        median_12mo: pd.Series
+    ) -> tuple[pd.Series,pd.Series]:
     """Extracts the 6 month median for select numeric video performance metrics.
     The trends of these stats are determined by calculating the percentage change
     between the 6 month and 12 month medians. Both the 6 month median metrics and
     their respective trends (compared to 12 month medians) will be included as
     header metrics on the streamlit dashboard.
         The metrics returned are;
-        - Video Publish Time
         - Views
         - Likes
         - Subscribers
@@ -251,52 +653,59 @@ def get_header_stats(df_agg: pd.DataFrame) -> tuple[pd.DataFrame,pd.DataFrame]:
         - VIEWS / SUBS_GAINED
         
     Args:
-        df_agg              - dataframe containing the raw data of video interactions, aggregated
-                                by Country and Subscriber status
+        median_6mo          - series containing the 6 month median of each header metric,
+                                from get_rolling_medians
+        median_12mo         - series containing the 12 month median of each numeric column,
+                                from get_rolling_medians
     Returns:
-        metric_date_6month  - dataframe containing the 6 month median for the select
+        median_6mo_metrics  - series containing the 6 month median for the select
                                 numeric metrics
-        metric_trends_df    - dataframe containing the percentage change in the 6 month
+        metric_trends_df    - series containing the percentage change in the 6 month
                                 medians compared to their 12 month median counterparts
     -----------------------------------------------------------------------------------
     Summary of Changes
     -----------------------------------------------------------------------------------
     Euan Newlands       07 Feb 2024     v0.1 - Initial Script
+    Euan Newlands       15 Oct 2026     v0.2 - Cached with st.cache_data
+    Euan Newlands       15 Oct 2026     v0.3 - Build the 6/12 month masks once and only
+                                                filter the numeric columns
+    Euan Newlands       15 Oct 2026     v0.4 - Medians passed in, calculated by
+                                                get_rolling_medians. No longer cached as
+                                                it's now just a column selection
+    Euan Newlands       15 Oct 2026     v0.5 - Metric names moved to module level
+                                                HEADER_NUMERIC
     """
-    header_metrics_df = df_agg[[
-        "Video Publish Time",
-        "Views",
-        "Likes",
-        "Subscribers",
-        "Shares",
-        "Comments Added",
-        "RPM(USD)",
-        "Average % Viewed",
-        "AVG_DURATION_SEC",
-        "ENGAGEMENT_RATIO",
-        "VIEWS / SUBS_GAINED"
-    ]]
-
-    # find median on numeric data, only if record within 6 & 12 months to latest video
-    metric_date_12month = header_metrics_df["Video Publish Time"].max() - pd.DateOffset(
-        months=12
-    )
-    metric_date_6month = header_metrics_df["Video Publish Time"].max() - pd.DateOffset(
-        months=6
-    )
-    median_12mo_metrics = header_metrics_df[
-        header_metrics_df["Video Publish Time"] >= metric_date_12month
-    ].median(numeric_only=True)
-
-    median_6mo_metrics = header_metrics_df[
-        header_metrics_df["Video Publish Time"] >= metric_date_6month
-    ].median(numeric_only=True)
+    median_6mo_metrics = median_6mo[list(HEADER_NUMERIC)]
+    median_12mo_metrics = median_12mo[list(HEADER_NUMERIC)]
 
     metric_trends_df = (median_6mo_metrics - median_12mo_metrics).div(median_12mo_metrics)
 
     return median_6mo_metrics, metric_trends_df
 
 
+@st.cache_resource(show_spinner=False)
+def index_by_video_title(df: pd.DataFrame) -> pd.DataFrame:
+    """Index a dataframe by `Video Title` and sort it, so that selecting a single video's
+    rows is an index lookup rather than comparing every row's title. Cached as a resource,
+    so the same indexed dataframe (and its lookup tables) are reused on every rerun. The
+    returned dataframe is shared between reruns, so must not be modified.
+
+    Args:
+        df          - a dataframe with a `Video Title` column
+    Returns:
+        df_by_title - the same dataframe indexed & sorted by `Video Title`, the column
+                        is kept too
+    -----------------------------------------------------------------------------------
+    Summary of Changes
+    -----------------------------------------------------------------------------------
+    Euan Newlands       15 Oct 2026     v0.1 - Initial Script
+    """
+    # unname the index, so `Video Title` only refers to the column
+    df_by_title = df.set_index('Video Title', drop=False).rename_axis(None).sort_index()
+
+    return df_by_title
+
+
 def build_sidebar() -> str:
     """This function contains all the streamlit code to build out the sidebar on the streamlit
     app. Initially, the siderbar only has a simple select box with 2 options
@@ -333,43 +742,52 @@ def _format_header_metrics(header_metrics: pd.DataFrame, header_trends: pd.DataF
     Summary of Changes
     -----------------------------------------------------------------------------------
     Euan Newlands       07 Feb 2024     v0.1 - Initial Script
+    Euan Newlands       15 Oct 2026     v0.2 - One st.columns(5) row per 5 metrics, rather
+                                                than stacking rows in the same 5 columns
+    Euan Newlands       15 Oct 2026     v0.3 - Round values as plain python floats
     """
-    columns = st.columns(5) # creates 5 side by side containers
+    metrics = header_metrics.index.to_list()
 
-    for i, met in enumerate(header_metrics.index):
-        with columns[i%5]:  # sorts into 2 rows of 5
-            st.metric(
+    for row_start in range(0, len(metrics), 5):
+        columns = st.columns(5) # creates a row of 5 side by side containers
+        for column, met in zip(columns, metrics[row_start:row_start + 5]):
+            column.metric(
                 label= met.replace('_',' ').title(),       # make nicer to read
-                value = header_metrics[met].round(1),
-                delta = "{:.2%}".format(header_trends[met])
+                value = round(float(header_metrics[met]), 1),
+                delta = "{:.2%}".format(float(header_trends[met]))
             )
-        
 
-def _style_positive_negative(val: int|float) -> str|None:
-    """A function to style values in a dataframe, using .style.map()
+
+def _style_positive_negative(df: pd.DataFrame) -> pd.DataFrame:
+    """A function to style the numeric values in a dataframe, using
+    .style.apply(axis=None). The whole block is styled in one vectorised step, rather
+    than calling a function per cell.
     
     Args:
-        val     - a dataframe containing the % difference of video stats compared to
+        df      - a dataframe containing the % difference of video stats compared to
                                 the 12-month median values.
     Returns:
-        format  - the CSS format to apply to the cell the value is in
+        formats - a dataframe of the CSS format to apply to each cell, same shape as df
     -----------------------------------------------------------------------------------
     Summary of Changes
     -----------------------------------------------------------------------------------
     Euan Newlands       10 Feb 2024     v0.1 - Initial Script
+    Euan Newlands       15 Oct 2026     v0.2 - Style a whole numeric block with np.where,
+                                                for use with .style.apply
     """
-    try:
-        format = "color:lime;" if val > 0 else "color:red;"
-        return format
-    except TypeError:
-        # ignore any non numeric values
-        pass
+    formats = pd.DataFrame(
+        np.where(df.to_numpy() > 0, "color:lime;", "color:red;"),
+        index=df.index,
+        columns=df.columns
+    )
+    return formats
 
 
 def _display_df_agg_diff(df_agg_diff: pd.DataFrame) -> None:
     """This function displays a dataframe containing the trends of numeric statistics
     captured in the aggregated by video dataset. The function then colours the +/-
-    by green/red.
+    by green/red. Only one page of videos is shown at a time, so the amount of data sent
+    to the browser doesn't grow with the size of the channel.
     
     Args:
         df_agg_diff         - a dataframe containing the % difference of video stats compared to
@@ -380,38 +798,45 @@ def _display_df_agg_diff(df_agg_diff: pd.DataFrame) -> None:
     Summary of Changes
     -----------------------------------------------------------------------------------
     Euan Newlands       07 Feb 2024     v0.1 - Initial Script
+    Euan Newlands       15 Oct 2026     v0.2 - PUBLISH_DATE derived with the .dt accessor
+                                                rather than a per-row apply
+    Euan Newlands       15 Oct 2026     v0.3 - Display DISPLAY_PAGE_SIZE videos at a time,
+                                                with a slider to page through the rest
+    Euan Newlands       15 Oct 2026     v0.4 - Column names moved to module level
+                                                DISPLAY_COLS
+    Euan Newlands       15 Oct 2026     v0.5 - Publish date kept as datetime64 and formatted
+                                                by the Styler, PUBLISH_DATE column dropped
+    Euan Newlands       15 Oct 2026     v0.6 - Numeric columns found with select_dtypes
+                                                rather than by calculating medians
+    Euan Newlands       15 Oct 2026     v0.7 - Numeric columns coloured in one vectorised
+                                                .style.apply, not a function call per cell
     """
+    # only send one page of videos to the browser, rather than the whole channel history.
+    # df_agg is sorted newest first, so page 1 is the latest videos
+    num_pages = -(-len(df_agg_diff) // DISPLAY_PAGE_SIZE)  # ceiling division
+    page_num = 1
+    if num_pages > 1:
+        page_num = st.slider('Page', min_value=1, max_value=num_pages, value=1)
+    page_start = (page_num - 1) * DISPLAY_PAGE_SIZE
+    df_agg_diff = df_agg_diff.iloc[page_start:page_start + DISPLAY_PAGE_SIZE]
+
     # extract select information to display in DF
-    df_agg_diff['PUBLISH_DATE'] = df_agg_diff['Video Publish Time'].apply(lambda x: x.date())
-    df_agg_diff_final = df_agg_diff.loc[:,[
-        'Video Title',
-        'PUBLISH_DATE',
-        'Views',
-        'Likes',
-        'Subscribers',
-        'AVG_DURATION_SEC',
-        'ENGAGEMENT_RATIO',
-        'VIEWS / SUBS_GAINED'
-    ]]
+    df_agg_diff_final = df_agg_diff.loc[:, list(DISPLAY_COLS)]
 
     # rename columns for display
-    df_agg_diff_final.columns = [
-        'Video Title',
-        'Publish Date',
-        'Views',
-        'Likes',
-        'Subscribers',
-        'Avg Watch Duration (s)',
-        'Engagement ratio',
-        'Views per Sub Gained'
-    ]
+    df_agg_diff_final = df_agg_diff_final.set_axis(list(DISPLAY_COLS.values()), axis=1)
 
     # format +/- columns (numeric columns only) into coloured % deltas
-    numeric_cols = df_agg_diff_final.median(numeric_only=True).index.to_list()  # find numeric col names
+    numeric_cols = df_agg_diff_final.select_dtypes(include='number').columns  # find numeric col names
     text_formats = {}
     for c in numeric_cols:
         text_formats[c] = '{:.1%}'.format
-    df_agg_diff_final = df_agg_diff_final.style.map(_style_positive_negative) # colour when dtype is numeric
+    # publish time stays datetime64, only the displayed cells are formatted as a date
+    text_formats['Publish Date'] = lambda d: '' if pd.isna(d) else d.strftime('%Y-%m-%d')
+    # colour the numeric block in one go
+    df_agg_diff_final = df_agg_diff_final.style.apply(
+        _style_positive_negative, axis=None, subset=numeric_cols
+    )
     df_agg_diff_final = df_agg_diff_final.format(text_formats)        # convert numeric to % format
 
     # display formatted df to app
@@ -437,17 +862,27 @@ def _video_select(df_agg: pd.DataFrame) -> str:
     return selected_video
 
 
-def _audience_sample(country: str) -> str:
-    """Convert country code to country name. Function passed to Pandas apply method"""
-    if country == 'US':
-        return 'USA'
-    elif country == 'GB':
-        return 'United Kingdom'
-    elif country == 'IN':
-        return 'India'
+def _filter_video(df_by_title: pd.DataFrame, video: str) -> pd.DataFrame:
+    """Return the rows for a single video, from a dataframe built by index_by_video_title.
+    Returns an empty dataframe if the video has no rows.
+
+    Args:
+        df_by_title - a dataframe indexed by `Video Title`
+        video       - name of the video selected
+    Returns:
+        df_video    - a copy of the selected video's rows
+    -----------------------------------------------------------------------------------
+    Summary of Changes
+    -----------------------------------------------------------------------------------
+    Euan Newlands       15 Oct 2026     v0.1 - Initial Script
+    """
+    if video in df_by_title.index:
+        df_video = df_by_title.loc[[video]].copy()
     else:
-        return 'Other'
-    
+        df_video = df_by_title.iloc[:0].copy()
+
+    return df_video
+
 
 def _engineer_subscriber_data(df_agg_sub: pd.DataFrame) -> pd.DataFrame:
     """Add a Country column, engineered from the country code column. The dataframe is sorted
@@ -462,8 +897,17 @@ def _engineer_subscriber_data(df_agg_sub: pd.DataFrame) -> pd.DataFrame:
     Summary of Changes
     -----------------------------------------------------------------------------------
     Euan Newlands       10 Feb 2024     v0.1 - Initial Script
+    Euan Newlands       15 Oct 2026     v0.2 - Country names looked up with Series.map on
+                                                COUNTRY_NAMES, replacing _audience_sample
+    Euan Newlands       15 Oct 2026     v0.3 - `Country Code` made categorical, so names
+                                                are looked up per category
     """  
-    df_agg_sub['COUNTRY'] = df_agg_sub['Country Code'].apply(_audience_sample)
+    # convert country code to country name, anything not in COUNTRY_NAMES is 'Other'. On
+    # a categorical the lookup runs once per distinct country code, not once per row
+    df_agg_sub['Country Code'] = df_agg_sub['Country Code'].astype('category')
+    df_agg_sub['COUNTRY'] = df_agg_sub['Country Code'].map(
+        lambda code: COUNTRY_NAMES.get(code, 'Other')
+    )
     df_agg_sub.sort_values('Is Subscribed', inplace=True)  # sort to ensure display is consistent
     return df_agg_sub
 
@@ -479,12 +923,21 @@ def _vid_subscriber_chart(df_agg_sub: pd.DataFrame):
     Summary of Changes
     -----------------------------------------------------------------------------------
     Euan Newlands       10 Feb 2024     v0.1 - Initial Script
+    Euan Newlands       15 Oct 2026     v0.2 - Views summed per country & subscriber status
+                                                before plotting
     """  
-    fig = px.bar(df_agg_sub, x='Views', y='Is Subscribed', color='COUNTRY', orientation='h')
+    # one bar segment per country & subscriber status, so plotly gets a handful of rows
+    # rather than a row per country code
+    views_by_country = df_agg_sub.groupby(
+        ['Is Subscribed', 'COUNTRY'], observed=True, sort=False
+    )['Views'].sum().reset_index()
+
+    fig = px.bar(views_by_country, x='Views', y='Is Subscribed', color='COUNTRY', orientation='h')
     st.subheader("Are viewers subscribed?")  
     st.plotly_chart(fig)
 
 
+@st.cache_data(show_spinner=False)
 def _engineer_avg_vid_performances(df_time_diff: pd.DataFrame):
     """Calculate the running totals for the 20, 50, 80th percentile view count on
     videos published in the last year. These values are used on a line chart to compare
@@ -499,47 +952,35 @@ def _engineer_avg_vid_performances(df_time_diff: pd.DataFrame):
     Summary of Changes
     -----------------------------------------------------------------------------------
     Euan Newlands       11 Feb 2024     v0.1 - Initial Script
+    Euan Newlands       15 Oct 2026     v0.2 - 12 month window is WINDOW_12MONTH, the same
+                                                as the median baselines
+    Euan Newlands       15 Oct 2026     v0.3 - Filter to the first 30 days before grouping,
+                                                groupby reducers instead of a pivot table
+                                                of lambdas. Cached with st.cache_data
     """
-    # calculate averages from just the latest 12 months of videos
-    date_12mo = df_time_diff['Video Publish Time'].max() - pd.DateOffset(months=12)
-    df_time_diff_yr = df_time_diff[df_time_diff['Video Publish Time'] >= date_12mo]
-
-    # pivot table to find aggregates on Views, grouped by DAYS_PUBLISHED
-    views_by_day = pd.pivot_table(
-        df_time_diff_yr,
-        index ='DAYS_PUBLISHED',
-        values='Views',
-        aggfunc=[
-            np.mean,
-            np.median,
-            lambda x: np.percentile(x, 80),
-            lambda x: np.percentile(x, 20)
-        ]
-    ).reset_index()
-
-    # rename columns
-    views_by_day.columns = [
-        'DAYS_PUBLISHED',
-        'MEAN_NUM_VIEWS',
-        'MEDIAN_NUM_VIEWS',
-        '80pct_NUM_VIEWS',
-        '20pct_NUM_VIEWS'
-    ]
-
-    # trim dataset to only return first 30 days
-    views_by_day_30days = views_by_day[views_by_day['DAYS_PUBLISHED'].between(0,30)]
-
-    # create a df with the running total, to plot trajectories
-    views_running_total = views_by_day_30days.copy()
-    views_running_total.loc[:,[
-        'MEDIAN_NUM_VIEWS',
-        '80pct_NUM_VIEWS',
-        '20pct_NUM_VIEWS'
-    ]] = views_running_total.loc[:,[
-        'MEDIAN_NUM_VIEWS',
-        '80pct_NUM_VIEWS',
-        '20pct_NUM_VIEWS'
-    ]].cumsum()
+    # calculate averages from just the latest 12 months of videos, over their first 30
+    # days. Both filters are applied before grouping, so only rows that end up on the
+    # chart are aggregated
+    publish_time = df_time_diff['Video Publish Time'].to_numpy()
+    days_published = df_time_diff['DAYS_PUBLISHED'].to_numpy()
+    date_12mo = publish_time.max() - WINDOW_12MONTH
+    in_window = (publish_time >= date_12mo) & (days_published >= 0) & (days_published <= 30)
+
+    # aggregates on Views, grouped by DAYS_PUBLISHED. groupby's built in reducers run in
+    # C, rather than calling np.percentile once per group
+    views_grouped = df_time_diff.loc[in_window, ['DAYS_PUBLISHED', 'Views']].groupby(
+        'DAYS_PUBLISHED'
+    )['Views']
+    views_running_total = pd.DataFrame({
+        'MEAN_NUM_VIEWS': views_grouped.mean(),
+        'MEDIAN_NUM_VIEWS': views_grouped.median(),
+        '80pct_NUM_VIEWS': views_grouped.quantile(0.8),
+        '20pct_NUM_VIEWS': views_grouped.quantile(0.2)
+    }).reset_index()
+
+    # running total of the percentiles, to plot trajectories
+    running_cols = ['MEDIAN_NUM_VIEWS', '80pct_NUM_VIEWS', '20pct_NUM_VIEWS']
+    views_running_total[running_cols] = views_running_total[running_cols].cumsum()
 
     return views_running_total
 
@@ -555,16 +996,41 @@ def _engineer_vid_performance(agg_time_filtered: pd.DataFrame) -> pd.DataFrame:
     Summary of Changes
     -----------------------------------------------------------------------------------
     Euan Newlands       11 Feb 2024     v0.1 - Initial Script
+    Euan Newlands       15 Oct 2026     v0.2 - Running total assigned as a whole column,
+                                                as Views is int32 after the downcast
     """
     first30 = agg_time_filtered[agg_time_filtered['DAYS_PUBLISHED'].between(0,30)]
     first30 = first30.sort_values('DAYS_PUBLISHED')
-    first30.loc[:,['Views']] = first30.loc[:,['Views']].cumsum()
+    # assign the whole column, the int64 running total replaces the int32 daily views
+    first30['Views'] = first30['Views'].cumsum()
 
     run_total = first30.loc[:,['Video Title','DAYS_PUBLISHED','Views']]
 
     return run_total
 
 
+def _line(x: pd.Series, y: pd.Series, name: str, line: dict) -> go.Scattergl:
+    """Build a WebGL line trace. Scattergl is drawn on the GPU, so charts stay responsive
+    as the number of points grows, where the default SVG Scatter slows down. Use this for
+    every line added to a dashboard figure.
+
+    Args:
+        x       - the x values of the line
+        y       - the y values of the line
+        name    - name of the trace, shown in the legend
+        line    - plotly line styling, e.g. dict(color='purple', dash='dash')
+    Returns:
+        trace   - a plotly Scattergl trace, to pass to go.Figure.add_trace
+    -----------------------------------------------------------------------------------
+    Summary of Changes
+    -----------------------------------------------------------------------------------
+    Euan Newlands       15 Oct 2026     v0.1 - Initial Script
+    """
+    trace = go.Scattergl(x=x, y=y, mode='lines', name=name, line=line)
+
+    return trace
+
+
 def _vid_performance_chart(
         vid_performance: pd.DataFrame,
         views_running_total:pd.DataFrame
@@ -581,41 +1047,38 @@ def _vid_performance_chart(
     Summary of Changes
     -----------------------------------------------------------------------------------
     Euan Newlands       11 Feb 2024     v0.1 - Initial Script
+    Euan Newlands       15 Oct 2026     v0.2 - Lines drawn with WebGL, via _line
     """
     st.subheader('How did the video perform?')
     line_fig = go.Figure()
     # add 20th percentile line
-    line_fig.add_trace(go.Scatter(
-        x=views_running_total['DAYS_PUBLISHED'],
-        y=views_running_total['20pct_NUM_VIEWS'],
-        mode='lines',
+    line_fig.add_trace(_line(
+        views_running_total['DAYS_PUBLISHED'],
+        views_running_total['20pct_NUM_VIEWS'],
         name='20th Percentile',
         line = dict(color='purple',dash='dash')
     ))
 
      # add median line
-    line_fig.add_trace(go.Scatter(
-        x=views_running_total['DAYS_PUBLISHED'],
-        y=views_running_total['MEDIAN_NUM_VIEWS'],
-        mode='lines',
+    line_fig.add_trace(_line(
+        views_running_total['DAYS_PUBLISHED'],
+        views_running_total['MEDIAN_NUM_VIEWS'],
         name='50th Percentile',
         line = dict(color='royalblue',dash='dash')
     ))
 
     # add 80th percentile line
-    line_fig.add_trace(go.Scatter(
-        x=views_running_total['DAYS_PUBLISHED'],
-        y=views_running_total['80pct_NUM_VIEWS'],
-        mode='lines',
+    line_fig.add_trace(_line(
+        views_running_total['DAYS_PUBLISHED'],
+        views_running_total['80pct_NUM_VIEWS'],
         name='80th Percentile',
         line = dict(color='black',dash='dash')
     ))
 
     # add median line
-    line_fig.add_trace(go.Scatter(
-        x=vid_performance['DAYS_PUBLISHED'],
-        y=vid_performance['Views'],
-        mode='lines',
+    line_fig.add_trace(_line(
+        vid_performance['DAYS_PUBLISHED'],
+        vid_performance['Views'],
         name='Current Video',
         line = dict(color='firebrick',width=8)
     ))
@@ -650,12 +1113,25 @@ def total_dashboard(
 
         header_trends   - dataframe containing the percentage change in the 6 month
                                 medians compared to their 12 month median counterparts
+
+        df_agg_diff     - dataframe containing the % difference of video stats compared
+                                to the 12-month median values
+
+        df_agg          - dataframe containing the engineered video stats
+
+        df_agg_sub      - dataframe of views by country & subscriber status, indexed by
+                                index_by_video_title
+
+        df_time_diff    - dataframe of video performance since publish date, indexed by
+                                index_by_video_title
     Returns:
         None
     -----------------------------------------------------------------------------------
     Summary of Changes
     -----------------------------------------------------------------------------------
     Euan Newlands       07 Feb 2024     v0.1 - Initial Script
+    Euan Newlands       15 Oct 2026     v0.2 - Selected video's rows found by index lookup,
+                                                removed unused df_agg filter
     """
     if page == 'Aggregate Metrics':
         _format_header_metrics(header_metrics, header_trends)
@@ -665,15 +1141,14 @@ def total_dashboard(
         video = _video_select(df_agg)
         if video != None:
             # get just selected video data, for subscribers
-            agg_filtered = df_agg[df_agg['Video Title'] == video]
-            agg_sub_filtered = df_agg_sub[df_agg_sub['Video Title'] == video]
+            agg_sub_filtered = _filter_video(df_agg_sub, video)
             agg_sub_filtered = _engineer_subscriber_data(agg_sub_filtered)
             _vid_subscriber_chart(agg_sub_filtered)
 
             # get just selected video data, for view performance over 30 days
             # get data for just most recent 12 months
             views_running_total = _engineer_avg_vid_performances(df_time_diff)
-            agg_time_filtered = df_time_diff[df_time_diff['Video Title'] == video]
+            agg_time_filtered = _filter_video(df_time_diff, video)
             vid_performance = _engineer_vid_performance(agg_time_filtered)
             _vid_performance_chart(vid_performance, views_running_total)
 
@@ -684,7 +1159,7 @@ def run_it(path_to_data):
 
     # load csvs
 
-    df_agg, df_agg_sub, df_comments, df_time = load_data(path_to_data)
+    df_agg, df_agg_sub, df_time = load_data(path_to_data)
 
     # engineer dfs - column names and data types
     df_agg = engineer_df_agg(df_agg)
@@ -694,8 +1169,13 @@ def run_it(path_to_data):
     df_time_diff = engineer_df_time_diff(df_agg, df_time)
 
     # find video metric trends by comparing to a 12 month median baseline
-    df_agg_diff = get_vid_stat_trends(df_agg)
-    header_metrics, header_trends = get_header_stats(df_agg)
+    median_6mo, median_12mo = get_rolling_medians(df_agg)
+    df_agg_diff = get_vid_stat_trends(df_agg, median_12mo)
+    header_metrics, header_trends = get_header_stats(median_6mo, median_12mo)
+
+    # index per video data by title, for quick lookups of the selected video
+    df_agg_sub = index_by_video_title(df_agg_sub)
+    df_time_diff = index_by_video_title(df_time_diff)
 
     # build streamlit app
     page = build_sidebar()
@@ -17,51 +17,70 @@ import numpy as np
 from vega_datasets import data
 import altair as alt
 
-source_df = data.countries()
+COUNTRIES = ('Afghanistan','Switzerland','United Kingdom','Japan','Rwanda')
+DUMBBELL_YEARS = [1955, 2000]
 
-afghan_swiss_uk_df = source_df.loc[source_df['country'].isin(
-    ('Afghanistan','Switzerland','United Kingdom','Japan','Rwanda')
-)]
+# streamlit reruns this whole script on every interaction, so the data selection and
+# chart specs are cached rather than rebuilt each time
 
-afghan_swiss_uk_df = afghan_swiss_uk_df.loc[:,['year', 'life_expect', 'country']]
 
-c = (
-   alt.Chart(afghan_swiss_uk_df)
-   .mark_line()
-   .encode(
-    x="year", y="life_expect", size="country", color="country", tooltip=[
-        "year", "life_expect", "country"
-    ], strokeDash='country'
-))
+@st.cache_data
+def load_countries():
+    return data.countries()
 
-st.altair_chart(c, use_container_width=True,theme='streamlit')
 
+@st.cache_data
+def select_life_expect(source_df):
+    # filter countries once here, both charts are built from this smaller df
+    country_mask = source_df['country'].isin(COUNTRIES).to_numpy()
+    return source_df.loc[country_mask, ['year', 'life_expect', 'country']]
+
+
+@st.cache_resource
+def build_life_expect_chart(afghan_swiss_uk_df):
+    return (
+       alt.Chart(afghan_swiss_uk_df)
+       .mark_line()
+       .encode(
+        x="year", y="life_expect", size="country", color="country", tooltip=[
+            "year", "life_expect", "country"
+        ], strokeDash='country'
+    ))
+
+
+@st.cache_resource
+def build_dumbbell_chart(afghan_swiss_uk_df):
+    # pre-filtered in pandas, so the chart only carries the rows it draws and vega
+    # doesn't re-filter the whole dataset in the browser
+    dumbbell_df = afghan_swiss_uk_df.loc[afghan_swiss_uk_df['year'].isin(DUMBBELL_YEARS)]
+
+    base = alt.Chart(dumbbell_df).encode(
+        alt.X("life_expect:Q")
+            .scale(zero=False)
+            .title("Life Expectancy (years)"),
+        alt.Y("country:N")
+            .axis(offset=5, ticks=False, minExtent=70, domain=False)
+            .title("Country")
+    )
+
+    line = base.mark_line().encode(
+        detail="country",
+        color=alt.value("#db646f")
+    )
+
+    point = base.mark_point(filled=True).encode(
+        alt.Color("year").scale(range=["#e6959c", "#911a24"], domain=DUMBBELL_YEARS),
+        size=alt.value(100),
+        opacity=alt.value(1),
+    )
+
+    return line+point
+
+
+source_df = load_countries()
+afghan_swiss_uk_df = select_life_expect(source_df)
+
+c = build_life_expect_chart(afghan_swiss_uk_df)
+st.altair_chart(c, use_container_width=True,theme='streamlit')
 
-base = alt.Chart(source_df).encode(
-    alt.X("life_expect:Q")
-        .scale(zero=False)
-        .title("Life Expectancy (years)"),
-    alt.Y("country:N")
-        .axis(offset=5, ticks=False, minExtent=70, domain=False)
-        .title("Country")
-).transform_filter(
-    alt.FieldOneOfPredicate(field="country", oneOf=('Afghanistan','Switzerland','United Kingdom','Japan','Rwanda'))
-).transform_filter(
-    alt.FieldOneOfPredicate(field='year', oneOf=[1955, 2000])
-)
-
-
-line = base.mark_line().encode(
-    detail="country",
-    color=alt.value("#db646f")
-).transform_filter(
-    alt.FieldOneOfPredicate(field="year", oneOf=[1955, 2000])
-)
-
-point = base.mark_point(filled=True).encode(
-    alt.Color("year").scale(range=["#e6959c", "#911a24"], domain=[1955, 2000]),
-    size=alt.value(100),
-    opacity=alt.value(1),
-)
-
-st.altair_chart(line+point, use_container_width=True,theme='streamlit')
\ No newline at end of file
+st.altair_chart(build_dumbbell_chart(afghan_swiss_uk_df), use_container_width=True,theme='streamlit')
\ No newline at end of file